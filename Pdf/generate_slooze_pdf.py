@@ -15,13 +15,63 @@ Date: February 2026
 # =============================================================================
 # STEP 1: INSTALL REQUIRED LIBRARIES
 # =============================================================================
-# Run this first if you haven't installed the dependencies:
-# !pip install fpdf2 pandas numpy matplotlib seaborn plotly prophet scikit-learn kagglehub -q
+# Run this first if you haven't installed the dependencies.
+# fpdf2 >= 2.8.3 is required: it provides FPDF.table() and the FontFace export
+# used by create_table, and buffers each page's content stream in a bytearray,
+# so _out() appends are amortized O(1). SloozePDF._write_row also relies on the
+# per-page font tracking (current_font_is_set_on_page) added in 2.8.3.
+# !pip install "fpdf2>=2.8.3" pandas numpy matplotlib seaborn plotly prophet scikit-learn kagglehub -q
 
-from fpdf import FPDF
+import re
+
+# Check that fpdf2 is installed and recent enough (fails fast, whether run
+# or imported); older releases lack APIs used below
+try:
+    import fpdf
+except ImportError as error:
+    raise ImportError(
+        'fpdf2 is not installed. Please run: pip install "fpdf2>=2.8.3"'
+    ) from error
+if tuple(map(int, re.findall(r'\d+', fpdf.__version__)[:3])) < (2, 8, 3):
+    raise ImportError(
+        f'fpdf2 {fpdf.__version__} is installed, but 2.8.3 or newer is '
+        'required. Please run: pip install -U "fpdf2>=2.8.3"'
+    )
+
+from fpdf import FPDF, FontFace
+from fpdf.enums import XPos, YPos
+from fpdf.syntax import PDFContentStream
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
 import os
 
+# Resolved once per process, for the cover date and the run summary
+_NOW = datetime.now()
+
+# Text styles shared by the SloozePDF helpers:
+# (font family, font style, size in pt, text color RGB)
+STYLE_H1 = ('Arial', 'B', 16, (26, 26, 46))            # Dark blue
+STYLE_H2 = ('Arial', 'B', 13, (22, 33, 62))            # Slightly lighter
+STYLE_H3 = ('Arial', 'B', 11, (51, 51, 51))
+STYLE_BODY = ('Arial', '', 10, (51, 51, 51))
+STYLE_BULLET = STYLE_BODY
+STYLE_TABLE_HEADER = ('Arial', 'B', 9, (51, 51, 51))
+STYLE_TABLE_CELL = ('Arial', '', 9, (51, 51, 51))
+STYLE_CODE = ('Courier', '', 9, (51, 51, 51))
+
+# Typographic characters the latin-1 core fonts cannot encode
+_TRANS = str.maketrans({
+    '\u2022': chr(149),  # Bullet (WinAnsi 0x95)
+    '\u2013': '-',
+    '\u2014': '-',
+    '\u2018': "'",
+    '\u2019': "'",
+    '\u201c': '"',
+    '\u201d': '"',
+})
+
 # =============================================================================
 # STEP 2: DEFINE THE PDF CLASS WITH CUSTOM HEADER/FOOTER
 # =============================================================================
@@ -32,6 +82,34 @@ class SloozePDF(FPDF):
     for Slooze Data Science Challenge documentation.
     """
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # String widths keyed by ((family, style, size), text)
+        self._width_cache = {}
+    
+    def normalize_text(self, text):
+        """Replace typographic characters that latin-1 core fonts cannot encode"""
+        # Other encodings (e.g. cp1252) have these characters natively;
+        # isascii() skips the translate() for the common plain-text case
+        if (not self.is_ttf_font and self.core_fonts_encoding == 'latin-1'
+                and not text.isascii()):
+            text = text.translate(_TRANS)
+        return super().normalize_text(text)
+    
+    def _apply(self, style):
+        """Apply a STYLE_* tuple (font and text color)"""
+        family, font_style, size, color = style
+        self.set_font(family, font_style, size)
+        self.set_text_color(*color)
+    
+    def _cached_width(self, font_key, text):
+        """Return get_string_width(text), memoized per font"""
+        key = (font_key, text)
+        width = self._width_cache.get(key)
+        if width is None:
+            width = self._width_cache[key] = self.get_string_width(text)
+        return width
+    
     def header(self):
         """Add header with document title on each page (except cover)"""
         # Skip header on first page (cover)
@@ -48,6 +126,7 @@ class SloozePDF(FPDF):
         
         # Add line below header
         self.set_draw_color(200, 200, 200)
+        self.set_line_width(0.5)
         self.line(15, self.get_y() + 5, 195, self.get_y() + 5)
         
         # Line break
@@ -71,71 +150,70 @@ class SloozePDF(FPDF):
     
     def chapter_title(self, title, level=1):
         """Add a chapter/section title with appropriate styling"""
+        # Register H1/H2 titles in the outline (bookmarks + table of contents).
+        # start_section() records the current page, so break first if the
+        # title cell itself would not fit on it.
+        if level <= 2:
+            if self.will_page_break(12 if level == 1 else 10):
+                self.add_page()
+            self.start_section(title, level=level - 1)
+        
         if level == 1:
             # Main chapter title (H1)
-            self.set_font('Arial', 'B', 16)
-            self.set_text_color(26, 26, 46)  # Dark blue
+            self._apply(STYLE_H1)
             self.cell(0, 12, title, 0, 1, 'L')
             
-            # Add underline
-            self.set_draw_color(233, 69, 96)  # Accent color
-            self.set_line_width(0.5)
-            self.line(15, self.get_y(), 195, self.get_y())
+            # Add underline (thin filled bar, no stroke state involved)
+            self.set_fill_color(233, 69, 96)  # Accent color
+            self.rect(15, self.get_y() - 0.25, 180, 0.5, 'F')
             
             self.ln(5)
             
         elif level == 2:
             # Section title (H2)
-            self.set_font('Arial', 'B', 13)
-            self.set_text_color(22, 33, 62)  # Slightly lighter
+            self._apply(STYLE_H2)
             self.cell(0, 10, title, 0, 1, 'L')
             self.ln(2)
             
         else:
             # Subsection title (H3)
-            self.set_font('Arial', 'B', 11)
-            self.set_text_color(51, 51, 51)
+            self._apply(STYLE_H3)
             self.cell(0, 8, title, 0, 1, 'L')
             self.ln(1)
     
     def chapter_body(self, body):
         """Add body text with proper formatting"""
-        self.set_font('Arial', '', 10)
-        self.set_text_color(51, 51, 51)
-        self.multi_cell(0, 6, body)
+        self._apply(STYLE_BODY)
+        self.multi_cell(0, 6, body, new_x=XPos.LMARGIN, new_y=YPos.NEXT)
         self.ln()
     
     def bullet_list(self, items, bold_prefix=True):
         """Add a bullet point list"""
-        self.set_font('Arial', '', 10)
-        self.set_text_color(51, 51, 51)
+        self._apply(STYLE_BULLET)
         
         for item in items:
-            # Check if item has a prefix to bold
+            self.set_x(self.l_margin + 5)  # Indent
+            self.cell(5, 6, chr(149), 0, 0, 'L')  # Bullet
+            text = item
+            # Bold prefix in its own cell; the rest wraps beside it
             if bold_prefix and ':' in item:
-                parts = item.split(':', 1)
-                self.cell(5)  # Indent
-                self.cell(5, 6, chr(149), 0, 0, 'L')  # Bullet
+                prefix, text = item.split(':', 1)
                 self.set_font('Arial', 'B', 10)
-                self.cell(self.get_string_width(parts[0] + ': '), 6, parts[0] + ':', 0, 0)
-                self.set_font('Arial', '', 10)
-                self.multi_cell(0, 6, parts[1])
-            else:
-                self.cell(5)  # Indent
-                self.cell(5, 6, chr(149), 0, 0, 'L')  # Bullet
-                self.multi_cell(0, 6, item)
+                font_key = (self.font_family, self.font_style, self.font_size_pt)
+                self.cell(self._cached_width(font_key, prefix + ': '), 6, prefix + ':', 0, 0)
+                self._apply(STYLE_BULLET)
+            self.multi_cell(0, 6, text, new_x=XPos.LMARGIN, new_y=YPos.NEXT)
         
         self.ln(2)
     
     def numbered_list(self, items):
         """Add a numbered list"""
-        self.set_font('Arial', '', 10)
-        self.set_text_color(51, 51, 51)
+        self._apply(STYLE_BULLET)
         
         for i, item in enumerate(items, 1):
             self.cell(5)  # Indent
             self.cell(10, 6, f'{i}.', 0, 0, 'L')
-            self.multi_cell(0, 6, item)
+            self.multi_cell(0, 6, item, new_x=XPos.LMARGIN, new_y=YPos.NEXT)
         
         self.ln(2)
     
@@ -161,8 +239,7 @@ class SloozePDF(FPDF):
         
         # Add content
         self.set_xy(20, start_y + 10)
-        self.set_font('Arial', '', 10)
-        self.set_text_color(51, 51, 51)
+        self._apply(STYLE_BODY)
         self.multi_cell(170, 5, content)
         
         # Move to next position
@@ -178,31 +255,93 @@ class SloozePDF(FPDF):
         # Add items
         self.bullet_list(items, bold_prefix=True)
     
+    def _fits_single_line(self, widths, texts, style):
+        """Check that every text fits on one line of its column"""
+        self._apply(style)
+        for width, text in zip(widths, texts):
+            if self.get_string_width(text) + 2 * self.c_margin > width:
+                return False
+        return True
+    
+    def _write_row(self, widths, texts, h, fill=False):
+        """
+        Draw a bordered, left-aligned table row as one content-stream write.
+        
+        All cells share one text object instead of going through cell()
+        (and its per-cell width, border and state bookkeeping). The caller
+        applies the row style and checks the row with _fits_single_line.
+        """
+        if self.will_page_break(h):
+            self.add_page(same=True)
+        # Per-page font tracking is fpdf2 internals (2.8.3+), see STEP 1
+        if not self.current_font_is_set_on_page:
+            self._out(self._set_font_for_page(self.current_font, self.font_size_pt))
+        
+        k = self.k
+        top = (self.h - self.y) * k
+        op = 'B' if fill else 'S'
+        ops = ['q']
+        x = self.x
+        for width in widths:
+            ops.append(f'{x * k:.2f} {top:.2f} {width * k:.2f} {-h * k:.2f} re {op}')
+            x += width
+        
+        # Baseline placement matches cell(); Td offsets are relative
+        baseline = (self.h - self.y - 0.5 * h - 0.3 * self.font_size) * k
+        ops.append(f'BT {self.text_color.serialize()} '
+                   f'{(self.x + self.c_margin) * k:.2f} {baseline:.2f} Td')
+        for i, text in enumerate(texts):
+            if i:
+                ops.append(f'{widths[i - 1] * k:.2f} 0 Td')
+            ops.append(self.current_font.encode_text(self.normalize_text(text)))
+        ops.append('ET Q')
+        self._out(' '.join(ops))
+        
+        self.ln(h)
+    
     def create_table(self, headers, data, col_widths=None):
         """Create a professional table"""
         # Default column widths if not provided
         if col_widths is None:
             col_widths = [40] * len(headers)
+        rows = [[str(cell) for cell in row] for row in data]
         
-        # Header styling
-        self.set_font('Arial', 'B', 9)
-        self.set_fill_color(248, 249, 250)
-        self.set_text_color(51, 51, 51)
+        # Border styling
+        self.set_draw_color(233, 69, 96)  # Accent borders
+        self.set_line_width(0.5)
         
-        # Draw header
-        for i, header in enumerate(headers):
-            self.cell(col_widths[i], 8, header, 1, 0, 'L', True)
-        self.ln()
+        # Tables whose cells all fit on one line are written as raw rows
+        if (self._fits_single_line(col_widths, headers, STYLE_TABLE_HEADER)
+                and all(self._fits_single_line(col_widths, row, STYLE_TABLE_CELL)
+                        for row in rows)):
+            self.set_fill_color(248, 249, 250)
+            self._apply(STYLE_TABLE_HEADER)
+            self._write_row(col_widths, headers, 8, fill=True)
+            self._apply(STYLE_TABLE_CELL)
+            for row in rows:
+                self._write_row(col_widths, row, 7)
+            self.ln(3)
+            return
         
-        # Data styling
-        self.set_font('Arial', '', 9)
-        self.set_fill_color(255, 255, 255)
+        # Otherwise let fpdf2 wrap the cells (headings get bold + light gray background)
+        self._apply(STYLE_TABLE_CELL)
+        self.set_fill_color(255, 255, 255)  # fpdf2 fills data cells with this
+        # Headings reuse the cell font family; only emphasis, size and colors differ
+        _, font_style, size, color = STYLE_TABLE_HEADER
+        headings_style = FontFace(emphasis=font_style, size_pt=size,
+                                  color=color, fill_color=(248, 249, 250))
         
-        # Draw data rows
-        for row in data:
-            for i, cell in enumerate(row):
-                self.cell(col_widths[i], 7, str(cell), 1, 0, 'L')
-            self.ln()
+        # Draw the whole table in a single fpdf2 table context
+        with self.table(col_widths=col_widths, width=sum(col_widths),
+                        align='LEFT', text_align='LEFT', line_height=7,
+                        headings_style=headings_style) as table:
+            row = table.row(min_height=8)  # Same heading height as raw rows
+            for header in headers:
+                row.cell(header)
+            for data_row in rows:
+                row = table.row()
+                for cell in data_row:
+                    row.cell(cell)
         
         self.ln(3)
 
@@ -211,17 +350,250 @@ class SloozePDF(FPDF):
 # STEP 3: CREATE THE PDF DOCUMENT
 # =============================================================================
 
-def create_slooze_documentation():
+# Static document content, built once and shared by every render
+
+# Section 1: Executive Summary
+_KEY_DELIVERABLES = (
+    "ABC Analysis: Classified 7,658 products by revenue contribution using the 80/20 rule",
+    "Demand Forecasting: Built Facebook Prophet time-series models for top 5 A-Class products",
+    "Reorder Point Analysis: Calculated optimal inventory triggers with 95% service level safety stock",
+    "Lead Time Analysis: Evaluated 120 vendors across $321.9 million procurement spend"
+)
+_METRICS_HEADERS = ('Metric', 'Value')
+_METRICS_DATA = (
+    ('Total Revenue Analyzed', '$33.1 Million'),
+    ('Unique Products', '7,658'),
+    ('Vendors Evaluated', '128'),
+    ('Store Locations', '79'),
+)
+
+# Section 2: Problem Statement
+_RISKS = (
+    "Stockouts of high-revenue items leading to lost sales",
+    "Excess inventory carrying costs tying up working capital",
+    "Missed optimization opportunities from lack of data-driven insights",
+    "Supplier inefficiencies going undetected"
+)
+_OBJECTIVES_HEADERS = ('Objective', 'Description', 'Success Metric')
+_OBJECTIVES_DATA = (
+    ('Inventory Optimization', 'Determine ideal stock levels by category', 'Reduced stockouts + carrying costs'),
+    ('Sales & Purchase Insights', 'Identify trends and supplier efficiency', 'Clear product/vendor segmentation'),
+    ('Process Improvement', 'Optimize procurement and stock control', 'Data-driven reorder triggers'),
+)
+_TASKS = (
+    "ABC Analysis - Product classification by revenue contribution",
+    "Demand Forecasting - Time-series prediction using Prophet",
+    "Reorder Point Analysis - Inventory trigger calculations with safety stock",
+    "Lead Time Analysis - Supplier performance evaluation"
+)
+
+# Section 3: Dataset Overview
+_DATASET_HEADERS = ('File Name', 'Size', 'Records', 'Purpose')
+_DATASET_DATA = (
+    ('SalesFINAL12312016.csv', '127.86 MB', '1,048,575', 'Sales transactions'),
+    ('PurchasesFINAL12312016.csv', '401.75 MB', '2,372,474', 'Purchase orders'),
+    ('BegInvFINAL12312016.csv', '19.31 MB', '206,529', 'Beginning inventory'),
+    ('EndInvFINAL12312016.csv', '21.00 MB', '224,489', 'Ending inventory'),
+    ('InvoicePurchases12312016.csv', '591 KB', '5,543', 'Invoice records'),
+    ('2017PurchasePricesDec.csv', '1.16 MB', '12,261', 'Price reference'),
+)
+_DATASET_CHARACTERISTICS = (
+    'Date Range: January 1 - December 31, 2016 (with February anomaly)',
+    'Geography: 79-81 store locations across multiple cities',
+    'Products: ~7,658 unique SKUs',
+    'Vendors: 128 significant suppliers (>10 purchase orders)',
+    'Total Records: 3.87 million rows analyzed'
+)
+
+# Section 4: Methodology
+_CLEANING_STEPS = (
+    "Standardized date formats (PODate, ReceivingDate, SalesDate)",
+    "Calculated derived metrics (LeadTime_Days, Revenue)",
+    "Removed invalid lead times (negative or zero values)",
+    "Converted 2,372,474 purchase records to datetime format",
+    "Stripped whitespace from string columns",
+    "Validated referential integrity across datasets"
+)
+_ABC_HEADERS = ('Class', 'Criteria', 'Priority')
+_ABC_DATA = (
+    ('A-Class', 'Top 80% cumulative revenue', 'High'),
+    ('B-Class', '80-95% cumulative revenue', 'Medium'),
+    ('C-Class', 'Bottom 5% cumulative revenue', 'Low'),
+)
+_ROP_HEADERS = ('Parameter', 'Value', 'Description')
+_ROP_DATA = (
+    ('Service Level', '95%', 'Z-score = 1.65 (industry standard)'),
+    ('Lead Time', '7.3-7.6 days', 'Vendor-specific average'),
+    ('Safety Stock', 'Variable', 'Based on demand variability'),
+)
+_VENDOR_HEADERS = ('Classification', 'Lead Time', 'Std Dev', 'Risk')
+_VENDOR_DATA = (
+    ('Premium', '<= 7.7 days', '<= 2.2 days', 'Low'),
+    ('Fast but Variable', '<= 7.7 days', '> 2.2 days', 'Medium'),
+    ('Slow but Steady', '> 7.7 days', '<= 2.2 days', 'Low-Medium'),
+    ('High Risk', '> 7.7 days', '> 2.2 days', 'High'),
+)
+
+# Section 5: Key Results
+_ABC_RESULTS_HEADERS = ('Category', 'Products', '% SKUs', 'Revenue', '% Revenue')
+_ABC_RESULTS_DATA = (
+    ('A-Class', '1,502', '19.6%', '$26.51M', '80.0%'),
+    ('B-Class', '1,813', '23.7%', '$4.97M', '15.0%'),
+    ('C-Class', '4,343', '56.7%', '$1.66M', '5.0%'),
+)
+_TOP5_HEADERS = ('Rank', 'Product', 'Revenue', '% of Total')
+_TOP5_DATA = (
+    ('1', 'Captain Morgan Spiced Rum', '$444,811', '1.34%'),
+    ('2', 'Ketel One Vodka', '$357,759', '1.08%'),
+    ('3', 'Jack Daniels No 7 Black', '$344,712', '1.04%'),
+    ('4', 'Absolut 80 Proof', '$288,135', '0.87%'),
+    ('5', "Tito's Handmade Vodka", '$275,163', '0.83%'),
+)
+_ROP_RESULTS_HEADERS = ('Product', 'ROP', 'Current', 'Status')
+_ROP_RESULTS_DATA = (
+    ('Captain Morgan', '5,676', '16,769', 'Healthy'),
+    ('Ketel One', '3,616', '16,770', 'Healthy'),
+    ('Jack Daniels', '2,620', '15,047', 'Healthy'),
+    ('Absolut', '2,978', '12,268', 'Healthy'),
+    ("Tito's", '2,811', '14,018', 'Healthy'),
+)
+_LEAD_HEADERS = ('Tier', 'Vendors', 'Spend', 'Risk')
+_LEAD_DATA = (
+    ('Premium', '26 (21.7%)', '$50.6M', 'Low'),
+    ('Fast but Variable', '34 (28.3%)', '$165.0M', 'Medium'),
+    ('Slow but Steady', '35 (29.2%)', '$82.9M', 'Low-Medium'),
+    ('High Risk', '25 (20.8%)', '$23.5M', 'High'),
+)
+
+# Section 6: Assumptions & Limitations
+_DATA_LIMITS = (
+    "Temporal Scope: Only 60 days of reliable data (January 2016). February showed 90% sales drop.",
+    "Missing Costs: No carrying cost or ordering cost data prevented EOQ calculation.",
+    "Vendor Names: Some vendors only had ID numbers; names extracted from InvoicePurchases."
+)
+_ASSUMPTIONS = (
+    "Service Level: 95% used for safety stock calculations (Z = 1.65, industry standard)",
+    "Lead Time Distribution: Assumed normal distribution for safety stock formula",
+    "Demand Stability: Used January 2016 averages (ignoring February anomaly)",
+    "Product Classification: ABC based on 2-month snapshot; annual data would be more robust"
+)
+_CONSTRAINTS = (
+    "Prophet Forecasts: Limited by short time series (60 observations)",
+    "External Regressors: No weather, holidays, or promotions included",
+    "Vendor Classification: Thresholds based on median rather than business SLAs"
+)
+
+# Section 7: Business Recommendations
+_IMMEDIATE_ACTIONS = (
+    "Dual-Source Vendor 3960: 40% of A-Class revenue depends on single supplier (Diageo)",
+    "Renegotiate SLAs: $85M spent with vendors slower than 7.7 days; implement penalties",
+    "Increase Safety Stock: Apply 1.5x multiplier for 'Fast but Variable' vendors",
+    "Consolidate Orders: Top 3 vendors = 618K orders; negotiate volume discounts"
+)
+_STRATEGIC_INITIATIVES = (
+    "Supplier Development: Move A-Class products to Premium vendors (currently 0/5)",
+    "Inventory Rationalization: Review 4,343 C-Class products for discontinuation",
+    "Data Infrastructure: Collect full year of data for seasonal forecasting"
+)
+_RISK_HEADERS = ('Risk Factor', 'Exposure', 'Mitigation')
+_RISK_DATA = (
+    ('Vendor Concentration', '21.7% Premium tier', 'Diversify supplier base'),
+    ('Variable Suppliers', '$165M (51.2%) spend', 'Increase safety stock'),
+    ('Lead Time Buffer', '7.6-day avg, 2.2-day var', 'Maintain safety coverage'),
+)
+
+# Section 8: How to Run
+_PREREQS = (
+    "Python 3.8 or higher",
+    "Google Colab (recommended) or Jupyter Notebook",
+    "16GB RAM (for large CSV processing)"
+)
+_STEPS = (
+    "Download Dataset: Automatically via KaggleHub",
+    "Phase 1: Data Loading & Cleaning",
+    "Phase 2: ABC Analysis",
+    "Phase 2.2: Demand Forecasting",
+    "Phase 2.3: Reorder Point Analysis",
+    "Phase 2.4: Lead Time Analysis"
+)
+_OUTPUTS = (
+    "ABC_Analysis_Results.csv",
+    "Reorder_Point_Analysis.csv",
+    "Vendor_Performance_Scorecard.csv",
+    "AClass_Vendor_Analysis.csv",
+    "Demand_Forecast_Detailed.csv"
+)
+
+# Section 9: Conclusion
+_DELIVERABLES_PROVIDED = (
+    "Automated data pipeline with KaggleHub integration",
+    "Statistical product classification (ABC Analysis)",
+    "Predictive demand models with uncertainty quantification",
+    "Operational reorder triggers with safety stock buffers",
+    "Strategic vendor scorecards with risk classification"
+)
+
+
+def _render_toc(pdf, outline):
     """
-    Generate the complete Slooze Data Science Challenge PDF documentation.
+    Render the table of contents from the document outline.
+    
+    Called by fpdf2 once the whole document is laid out, so page numbers
+    always match the rendered sections. Only numbered titles are listed.
+    """
+    pdf.set_x(pdf.l_margin)
+    pdf.set_text_color(51, 51, 51)
+    
+    for section in outline:
+        if not section.name[:1].isdigit():
+            continue
+        
+        if section.level > 0:
+            pdf.cell(10)  # Indent
+            pdf.set_font('Arial', '', 10)
+        else:
+            pdf.set_font('Arial', 'B', 11)
+        
+        link = pdf.add_link(page=section.page_number)
+        pdf.cell(150, 7, section.name, 0, 0, link=link)
+        pdf.cell(0, 7, str(section.page_number), 0, 1, 'R', link=link)
+
+
+@contextmanager
+def _stream_compression(level):
+    """
+    Temporarily set the zlib level fpdf2 uses for page content streams.
+    
+    Text streams compress to within a few percent of the default level 6
+    at level 1, for noticeably less CPU time. Images keep the default.
+    """
+    previous = PDFContentStream._COMPRESSION_LEVEL
+    PDFContentStream._COMPRESSION_LEVEL = level
+    try:
+        yield
+    finally:
+        PDFContentStream._COMPRESSION_LEVEL = previous
+
+
+@lru_cache(maxsize=8)
+def _render_pdf(cover_date):
+    """
+    Render the complete documentation in memory.
+    
+    The cover date is the only input that varies between runs, so the
+    rendered document is cached per date and repeated generations reuse it.
+    
+    Args:
+        cover_date (str): Month/year printed on the cover page
     
     Returns:
-        str: Path to the generated PDF file
+        tuple: (read-only memoryview of the PDF bytes, number of pages)
     """
     
     # Initialize PDF
     pdf = SloozePDF()
     pdf.set_auto_page_break(auto=True, margin=20)
+    pdf.set_compression(True)
     
     # ========================================================================
     # COVER PAGE
@@ -269,7 +641,7 @@ def create_slooze_documentation():
     pdf.set_text_color(180, 180, 180)
     pdf.cell(180, 8, 'Technical Documentation', 0, 1, 'C')
     pdf.cell(180, 8, 'Comprehensive Analysis Report', 0, 1, 'C')
-    pdf.cell(180, 8, datetime.now().strftime('%B %Y'), 0, 1, 'C')
+    pdf.cell(180, 8, cover_date, 0, 1, 'C')
     
     # ========================================================================
     # TABLE OF CONTENTS
@@ -277,42 +649,13 @@ def create_slooze_documentation():
     pdf.add_page()
     pdf.chapter_title('Table of Contents', level=1)
     
-    toc_items = [
-        ('1. Executive Summary', 3),
-        ('2. Problem Statement & Objectives', 4),
-        ('   2.1 Business Context', 4),
-        ('   2.2 Core Objectives', 4),
-        ('3. Dataset Overview', 5),
-        ('4. Methodology', 6),
-        ('   4.1 Phase 1: Data Exploration & Cleaning', 6),
-        ('   4.2 Phase 2: ABC Analysis', 7),
-        ('   4.3 Phase 2.2: Demand Forecasting', 8),
-        ('   4.4 Phase 2.3: Reorder Point Analysis', 8),
-        ('   4.5 Phase 2.4: Lead Time Analysis', 9),
-        ('5. Key Results', 10),
-        ('6. Assumptions & Limitations', 12),
-        ('7. Business Recommendations', 13),
-        ('8. How to Run the Code', 14),
-        ('9. Conclusion', 15),
-    ]
-    
-    pdf.set_font('Arial', '', 11)
-    pdf.set_text_color(51, 51, 51)
-    
-    for item, page in toc_items:
-        if item.startswith('   '):
-            pdf.cell(10)  # Indent
-            pdf.set_font('Arial', '', 10)
-        else:
-            pdf.set_font('Arial', 'B', 11)
-        
-        pdf.cell(150, 7, item.strip(), 0, 0)
-        pdf.cell(0, 7, str(page), 0, 1, 'R')
+    # Entries and page numbers are filled in by _render_toc at output time;
+    # this also breaks to the next page
+    pdf.insert_toc_placeholder(_render_toc, pages=1)
     
     # ========================================================================
     # SECTION 1: EXECUTIVE SUMMARY
     # ========================================================================
-    pdf.add_page()
     pdf.chapter_title('1. Executive Summary', level=1)
     
     pdf.chapter_body(
@@ -325,13 +668,7 @@ def create_slooze_documentation():
     
     pdf.chapter_title('Key Deliverables', level=2)
     
-    deliverables = [
-        "ABC Analysis: Classified 7,658 products by revenue contribution using the 80/20 rule",
-        "Demand Forecasting: Built Facebook Prophet time-series models for top 5 A-Class products",
-        "Reorder Point Analysis: Calculated optimal inventory triggers with 95% service level safety stock",
-        "Lead Time Analysis: Evaluated 120 vendors across $321.9 million procurement spend"
-    ]
-    pdf.bullet_list(deliverables)
+    pdf.bullet_list(_KEY_DELIVERABLES)
     
     pdf.key_finding_box(
         'Critical Finding',
@@ -343,14 +680,7 @@ def create_slooze_documentation():
     # Metrics summary
     pdf.chapter_title('Summary Metrics', level=2)
     
-    metrics_headers = ['Metric', 'Value']
-    metrics_data = [
-        ['Total Revenue Analyzed', '$33.1 Million'],
-        ['Unique Products', '7,658'],
-        ['Vendors Evaluated', '128'],
-        ['Store Locations', '79'],
-    ]
-    pdf.create_table(metrics_headers, metrics_data, [80, 80])
+    pdf.create_table(_METRICS_HEADERS, _METRICS_DATA, [80, 80])
     
     # ========================================================================
     # SECTION 2: PROBLEM STATEMENT
@@ -366,33 +696,15 @@ def create_slooze_documentation():
         "inadequate for this data volume, creating risks of:"
     )
     
-    risks = [
-        "Stockouts of high-revenue items leading to lost sales",
-        "Excess inventory carrying costs tying up working capital",
-        "Missed optimization opportunities from lack of data-driven insights",
-        "Supplier inefficiencies going undetected"
-    ]
-    pdf.bullet_list(risks)
+    pdf.bullet_list(_RISKS)
     
     pdf.chapter_title('2.2 Core Objectives', level=2)
     
-    objectives_headers = ['Objective', 'Description', 'Success Metric']
-    objectives_data = [
-        ['Inventory Optimization', 'Determine ideal stock levels by category', 'Reduced stockouts + carrying costs'],
-        ['Sales & Purchase Insights', 'Identify trends and supplier efficiency', 'Clear product/vendor segmentation'],
-        ['Process Improvement', 'Optimize procurement and stock control', 'Data-driven reorder triggers'],
-    ]
-    pdf.create_table(objectives_headers, objectives_data, [50, 65, 55])
+    pdf.create_table(_OBJECTIVES_HEADERS, _OBJECTIVES_DATA, [50, 65, 55])
     
     pdf.chapter_title('Analytical Tasks Completed', level=2)
     
-    tasks = [
-        "ABC Analysis - Product classification by revenue contribution",
-        "Demand Forecasting - Time-series prediction using Prophet",
-        "Reorder Point Analysis - Inventory trigger calculations with safety stock",
-        "Lead Time Analysis - Supplier performance evaluation"
-    ]
-    pdf.numbered_list(tasks)
+    pdf.numbered_list(_TASKS)
     
     # ========================================================================
     # SECTION 3: DATASET OVERVIEW
@@ -402,26 +714,11 @@ def create_slooze_documentation():
     
     pdf.chapter_title('Data Sources (6 Files)', level=2)
     
-    dataset_headers = ['File Name', 'Size', 'Records', 'Purpose']
-    dataset_data = [
-        ['SalesFINAL12312016.csv', '127.86 MB', '1,048,575', 'Sales transactions'],
-        ['PurchasesFINAL12312016.csv', '401.75 MB', '2,372,474', 'Purchase orders'],
-        ['BegInvFINAL12312016.csv', '19.31 MB', '206,529', 'Beginning inventory'],
-        ['EndInvFINAL12312016.csv', '21.00 MB', '224,489', 'Ending inventory'],
-        ['InvoicePurchases12312016.csv', '591 KB', '5,543', 'Invoice records'],
-        ['2017PurchasePricesDec.csv', '1.16 MB', '12,261', 'Price reference'],
-    ]
-    pdf.create_table(dataset_headers, dataset_data, [55, 30, 30, 55])
+    pdf.create_table(_DATASET_HEADERS, _DATASET_DATA, [55, 30, 30, 55])
     
     pdf.chapter_title('Data Quality Summary', level=2)
     
-    pdf.info_box('Dataset Characteristics', [
-        'Date Range: January 1 - December 31, 2016 (with February anomaly)',
-        'Geography: 79-81 store locations across multiple cities',
-        'Products: ~7,658 unique SKUs',
-        'Vendors: 128 significant suppliers (>10 purchase orders)',
-        'Total Records: 3.87 million rows analyzed'
-    ])
+    pdf.info_box('Dataset Characteristics', _DATASET_CHARACTERISTICS)
     
     # ========================================================================
     # SECTION 4: METHODOLOGY
@@ -439,15 +736,7 @@ def create_slooze_documentation():
     
     pdf.chapter_title('Data Cleaning Steps', level=3)
     
-    cleaning_steps = [
-        "Standardized date formats (PODate, ReceivingDate, SalesDate)",
-        "Calculated derived metrics (LeadTime_Days, Revenue)",
-        "Removed invalid lead times (negative or zero values)",
-        "Converted 2,372,474 purchase records to datetime format",
-        "Stripped whitespace from string columns",
-        "Validated referential integrity across datasets"
-    ]
-    pdf.numbered_list(cleaning_steps)
+    pdf.numbered_list(_CLEANING_STEPS)
     
     pdf.chapter_title('4.2 Phase 2: ABC Analysis', level=2)
     
@@ -458,13 +747,7 @@ def create_slooze_documentation():
     
     pdf.chapter_title('Classification Criteria', level=3)
     
-    abc_headers = ['Class', 'Criteria', 'Priority']
-    abc_data = [
-        ['A-Class', 'Top 80% cumulative revenue', 'High'],
-        ['B-Class', '80-95% cumulative revenue', 'Medium'],
-        ['C-Class', 'Bottom 5% cumulative revenue', 'Low'],
-    ]
-    pdf.create_table(abc_headers, abc_data, [30, 80, 50])
+    pdf.create_table(_ABC_HEADERS, _ABC_DATA, [30, 80, 50])
     
     pdf.chapter_title('4.3 Phase 2.2: Demand Forecasting', level=2)
     
@@ -477,31 +760,15 @@ def create_slooze_documentation():
     pdf.chapter_title('4.4 Phase 2.3: Reorder Point Analysis', level=2)
     
     pdf.chapter_body(
-        "ROP = (Average Daily Demand x Lead Time) + Safety Stock"
-    )
-    
-    pdf.chapter_body(
+        "ROP = (Average Daily Demand x Lead Time) + Safety Stock\n\n"
         "Where Safety Stock = Z x Standard Deviation x sqrt(Lead Time)"
     )
     
-    rop_headers = ['Parameter', 'Value', 'Description']
-    rop_data = [
-        ['Service Level', '95%', 'Z-score = 1.65 (industry standard)'],
-        ['Lead Time', '7.3-7.6 days', 'Vendor-specific average'],
-        ['Safety Stock', 'Variable', 'Based on demand variability'],
-    ]
-    pdf.create_table(rop_headers, rop_data, [40, 35, 75])
+    pdf.create_table(_ROP_HEADERS, _ROP_DATA, [40, 35, 75])
     
     pdf.chapter_title('4.5 Phase 2.4: Lead Time Analysis', level=2)
     
-    vendor_headers = ['Classification', 'Lead Time', 'Std Dev', 'Risk']
-    vendor_data = [
-        ['Premium', '<= 7.7 days', '<= 2.2 days', 'Low'],
-        ['Fast but Variable', '<= 7.7 days', '> 2.2 days', 'Medium'],
-        ['Slow but Steady', '> 7.7 days', '<= 2.2 days', 'Low-Medium'],
-        ['High Risk', '> 7.7 days', '> 2.2 days', 'High'],
-    ]
-    pdf.create_table(vendor_headers, vendor_data, [45, 35, 35, 25])
+    pdf.create_table(_VENDOR_HEADERS, _VENDOR_DATA, [45, 35, 35, 25])
     
     # ========================================================================
     # SECTION 5: KEY RESULTS
@@ -511,37 +778,15 @@ def create_slooze_documentation():
     
     pdf.chapter_title('ABC Analysis Results', level=2)
     
-    abc_results_headers = ['Category', 'Products', '% SKUs', 'Revenue', '% Revenue']
-    abc_results_data = [
-        ['A-Class', '1,502', '19.6%', '$26.51M', '80.0%'],
-        ['B-Class', '1,813', '23.7%', '$4.97M', '15.0%'],
-        ['C-Class', '4,343', '56.7%', '$1.66M', '5.0%'],
-    ]
-    pdf.create_table(abc_results_headers, abc_results_data, [25, 30, 25, 35, 30])
+    pdf.create_table(_ABC_RESULTS_HEADERS, _ABC_RESULTS_DATA, [25, 30, 25, 35, 30])
     
     pdf.chapter_title('Top 5 Revenue Products', level=2)
     
-    top5_headers = ['Rank', 'Product', 'Revenue', '% of Total']
-    top5_data = [
-        ['1', 'Captain Morgan Spiced Rum', '$444,811', '1.34%'],
-        ['2', 'Ketel One Vodka', '$357,759', '1.08%'],
-        ['3', 'Jack Daniels No 7 Black', '$344,712', '1.04%'],
-        ['4', 'Absolut 80 Proof', '$288,135', '0.87%'],
-        ['5', "Tito's Handmade Vodka", '$275,163', '0.83%'],
-    ]
-    pdf.create_table(top5_headers, top5_data, [15, 85, 35, 25])
+    pdf.create_table(_TOP5_HEADERS, _TOP5_DATA, [15, 85, 35, 25])
     
     pdf.chapter_title('Reorder Point Results', level=2)
     
-    rop_headers = ['Product', 'ROP', 'Current', 'Status']
-    rop_data = [
-        ['Captain Morgan', '5,676', '16,769', 'Healthy'],
-        ['Ketel One', '3,616', '16,770', 'Healthy'],
-        ['Jack Daniels', '2,620', '15,047', 'Healthy'],
-        ['Absolut', '2,978', '12,268', 'Healthy'],
-        ["Tito's", '2,811', '14,018', 'Healthy'],
-    ]
-    pdf.create_table(rop_headers, rop_data, [45, 35, 35, 25])
+    pdf.create_table(_ROP_RESULTS_HEADERS, _ROP_RESULTS_DATA, [45, 35, 35, 25])
     
     pdf.key_finding_box(
         'Inventory Status',
@@ -551,14 +796,7 @@ def create_slooze_documentation():
     
     pdf.chapter_title('Lead Time Analysis Results', level=2)
     
-    lead_headers = ['Tier', 'Vendors', 'Spend', 'Risk']
-    lead_data = [
-        ['Premium', '26 (21.7%)', '$50.6M', 'Low'],
-        ['Fast but Variable', '34 (28.3%)', '$165.0M', 'Medium'],
-        ['Slow but Steady', '35 (29.2%)', '$82.9M', 'Low-Medium'],
-        ['High Risk', '25 (20.8%)', '$23.5M', 'High'],
-    ]
-    pdf.create_table(lead_headers, lead_data, [40, 35, 35, 30])
+    pdf.create_table(_LEAD_HEADERS, _LEAD_DATA, [40, 35, 35, 30])
     
     pdf.key_finding_box(
         'Critical Supplier Risk',
@@ -575,31 +813,15 @@ def create_slooze_documentation():
     
     pdf.chapter_title('Data Limitations', level=2)
     
-    data_limits = [
-        "Temporal Scope: Only 60 days of reliable data (January 2016). February showed 90% sales drop.",
-        "Missing Costs: No carrying cost or ordering cost data prevented EOQ calculation.",
-        "Vendor Names: Some vendors only had ID numbers; names extracted from InvoicePurchases."
-    ]
-    pdf.numbered_list(data_limits)
+    pdf.numbered_list(_DATA_LIMITS)
     
     pdf.chapter_title('Analytical Assumptions', level=2)
     
-    assumptions = [
-        "Service Level: 95% used for safety stock calculations (Z = 1.65, industry standard)",
-        "Lead Time Distribution: Assumed normal distribution for safety stock formula",
-        "Demand Stability: Used January 2016 averages (ignoring February anomaly)",
-        "Product Classification: ABC based on 2-month snapshot; annual data would be more robust"
-    ]
-    pdf.numbered_list(assumptions)
+    pdf.numbered_list(_ASSUMPTIONS)
     
     pdf.chapter_title('Technical Constraints', level=2)
     
-    constraints = [
-        "Prophet Forecasts: Limited by short time series (60 observations)",
-        "External Regressors: No weather, holidays, or promotions included",
-        "Vendor Classification: Thresholds based on median rather than business SLAs"
-    ]
-    pdf.numbered_list(constraints)
+    pdf.numbered_list(_CONSTRAINTS)
     
     # ========================================================================
     # SECTION 7: BUSINESS RECOMMENDATIONS
@@ -609,32 +831,15 @@ def create_slooze_documentation():
     
     pdf.chapter_title('Immediate Actions (0-30 Days)', level=2)
     
-    rec1 = [
-        "Dual-Source Vendor 3960: 40% of A-Class revenue depends on single supplier (Diageo)",
-        "Renegotiate SLAs: $85M spent with vendors slower than 7.7 days; implement penalties",
-        "Increase Safety Stock: Apply 1.5x multiplier for 'Fast but Variable' vendors",
-        "Consolidate Orders: Top 3 vendors = 618K orders; negotiate volume discounts"
-    ]
-    pdf.numbered_list(rec1)
+    pdf.numbered_list(_IMMEDIATE_ACTIONS)
     
     pdf.chapter_title('Strategic Initiatives (30-90 Days)', level=2)
     
-    rec2 = [
-        "Supplier Development: Move A-Class products to Premium vendors (currently 0/5)",
-        "Inventory Rationalization: Review 4,343 C-Class products for discontinuation",
-        "Data Infrastructure: Collect full year of data for seasonal forecasting"
-    ]
-    pdf.numbered_list(rec2)
+    pdf.numbered_list(_STRATEGIC_INITIATIVES)
     
     pdf.chapter_title('Risk Mitigation Priorities', level=2)
     
-    risk_headers = ['Risk Factor', 'Exposure', 'Mitigation']
-    risk_data = [
-        ['Vendor Concentration', '21.7% Premium tier', 'Diversify supplier base'],
-        ['Variable Suppliers', '$165M (51.2%) spend', 'Increase safety stock'],
-        ['Lead Time Buffer', '7.6-day avg, 2.2-day var', 'Maintain safety coverage'],
-    ]
-    pdf.create_table(risk_headers, risk_data, [45, 55, 50])
+    pdf.create_table(_RISK_HEADERS, _RISK_DATA, [45, 55, 50])
     
     # ========================================================================
     # SECTION 8: HOW TO RUN
@@ -644,42 +849,22 @@ def create_slooze_documentation():
     
     pdf.chapter_title('Prerequisites', level=2)
     
-    prereqs = [
-        "Python 3.8 or higher",
-        "Google Colab (recommended) or Jupyter Notebook",
-        "16GB RAM (for large CSV processing)"
-    ]
-    pdf.bullet_list(prereqs)
+    pdf.bullet_list(_PREREQS)
     
     pdf.chapter_title('Installation', level=2)
     
-    pdf.set_font('Courier', '', 9)
+    pdf._apply(STYLE_CODE)
     pdf.set_fill_color(245, 245, 245)
     pdf.multi_cell(0, 6, "pip install pandas numpy matplotlib seaborn plotly prophet scikit-learn kagglehub", fill=True)
     pdf.ln(3)
     
     pdf.chapter_title('Execution Steps', level=2)
     
-    steps = [
-        "Download Dataset: Automatically via KaggleHub",
-        "Phase 1: Data Loading & Cleaning",
-        "Phase 2: ABC Analysis",
-        "Phase 2.2: Demand Forecasting",
-        "Phase 2.3: Reorder Point Analysis",
-        "Phase 2.4: Lead Time Analysis"
-    ]
-    pdf.numbered_list(steps)
+    pdf.numbered_list(_STEPS)
     
     pdf.chapter_title('Output Files', level=2)
     
-    outputs = [
-        "ABC_Analysis_Results.csv",
-        "Reorder_Point_Analysis.csv",
-        "Vendor_Performance_Scorecard.csv",
-        "AClass_Vendor_Analysis.csv",
-        "Demand_Forecast_Detailed.csv"
-    ]
-    pdf.bullet_list(outputs)
+    pdf.bullet_list(_OUTPUTS)
     
     # ========================================================================
     # SECTION 9: CONCLUSION
@@ -691,10 +876,7 @@ def create_slooze_documentation():
         "This analysis transformed Slooze's raw transactional data into actionable "
         "inventory intelligence. Through ABC classification, we identified that 20% "
         "of products drive 80% of revenue - yet these critical items rely on variable "
-        "suppliers, creating significant supply chain vulnerability."
-    )
-    
-    pdf.chapter_body(
+        "suppliers, creating significant supply chain vulnerability.\n\n"
         "The reorder point system provides data-driven triggers for procurement, while "
         "vendor analysis reveals $85 million in spend with suboptimal suppliers. By "
         "implementing the dual-sourcing and safety stock recommendations, Slooze can "
@@ -703,14 +885,7 @@ def create_slooze_documentation():
     
     pdf.chapter_title('Key Deliverables Provided', level=2)
     
-    deliverables = [
-        "Automated data pipeline with KaggleHub integration",
-        "Statistical product classification (ABC Analysis)",
-        "Predictive demand models with uncertainty quantification",
-        "Operational reorder triggers with safety stock buffers",
-        "Strategic vendor scorecards with risk classification"
-    ]
-    pdf.bullet_list(deliverables)
+    pdf.bullet_list(_DELIVERABLES_PROVIDED)
     
     pdf.key_finding_box(
         'Final Note',
@@ -725,23 +900,66 @@ def create_slooze_documentation():
     pdf.set_text_color(128, 128, 128)
     pdf.cell(0, 10, '--- End of Documentation ---', 0, 0, 'C')
     
+    # Cache a read-only view of fpdf2's output buffer rather than a bytes()
+    # copy of it, so the document is held in memory only once
+    with _stream_compression(1):
+        pdf_buffer = pdf.output()
+    return memoryview(pdf_buffer).toreadonly(), pdf.page_no()
+
+
+def create_slooze_documentation():
+    """
+    Generate the complete Slooze Data Science Challenge PDF documentation.
+    
+    Returns:
+        str: Path to the generated PDF file
+    """
+    pdf_view, page_count = _render_pdf(_NOW.strftime('%B %Y'))
+    
     # ========================================================================
     # SAVE THE PDF
     # ========================================================================
     output_filename = 'Slooze_Analysis_Documentation_FPDF.pdf'
-    pdf.output(output_filename)
+    with open(output_filename, 'wb') as f:
+        f.write(pdf_view)
     
     print(f"=" * 60)
     print(f"PDF GENERATED SUCCESSFULLY!")
     print(f"=" * 60)
     print(f"Filename: {output_filename}")
-    print(f"Pages: {pdf.page_no()}")
-    print(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"Pages: {page_count}")
+    print(f"Generated: {_NOW.strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"=" * 60)
     
     return output_filename
 
 
+def _render_one(config):
+    """Render one document for create_many() and return its PDF bytes"""
+    pdf_view, _ = _render_pdf(config.get('cover_date', _NOW.strftime('%B %Y')))
+    # memoryviews cannot be pickled back to the parent process
+    return bytes(pdf_view)
+
+
+def create_many(configs, workers=None):
+    """
+    Render several documents in parallel, one worker process per CPU.
+    
+    Each FPDF instance lives entirely inside its worker, so nothing is
+    shared between documents and rendering is not limited by the GIL.
+    
+    Args:
+        configs (list): One dict per document; 'cover_date' overrides the
+            month/year printed on the cover
+        workers (int): Number of worker processes (defaults to CPU count)
+    
+    Returns:
+        list: PDF bytes for each config, in the same order
+    """
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_render_one, configs))
+
+
 # =============================================================================
 # MAIN EXECUTION
 # =============================================================================
@@ -751,14 +969,6 @@ if __name__ == "__main__":
     print("SLOOZE DATA SCIENCE CHALLENGE - PDF DOCUMENTATION GENERATOR")
     print("=" * 60 + "\n")
     
-    # Check if fpdf is installed
-    try:
-        from fpdf import FPDF
-    except ImportError:
-        print("ERROR: fpdf2 is not installed.")
-        print("Please run: pip install fpdf2")
-        exit(1)
-    
     # Generate the PDF
     output_file = create_slooze_documentation()
     